@@ -0,0 +1,3 @@
+"""
+KanoonSathi backend: legal document analysis, translation and the API server
+"""
@@ -0,0 +1,59 @@
+"""
+OCR helpers run in a separate process pool by the server
+"""
+import logging
+import os
+
+# Import pytesseract and PIL for OCR
+from pytesseract import image_to_string
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# LSTM engine only (skips loading the legacy engine) and a single uniform block of
+# text, which suits scanned legal pages
+TESSERACT_CONFIG = "--oem 1 --psm 6"
+
+# Largest image, in pixels, worth handing to Tesseract; anything bigger is rejected
+# so a decompression bomb cannot tie up an OCR worker for minutes
+MAX_OCR_PIXELS = 25_000_000
+
+def init_ocr_worker():
+    """
+    Limit each OCR worker's Tesseract to one thread
+    
+    Tesseract parallelizes with OpenMP by default; with several workers already
+    running side by side that only oversubscribes the cores.
+    """
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+class ImageTooLargeError(ValueError):
+    """Raised when an uploaded image has more pixels than MAX_OCR_PIXELS"""
+
+def run_ocr(temp_path):
+    """
+    Extract text from an image file with Tesseract
+    
+    Kept in its own module so OCR worker processes only import what they need.
+    """
+    try:
+        # Opening only reads the header, so this is cheap even for huge images. PIL
+        # itself refuses images over twice its own bomb limit before we see the size
+        try:
+            with Image.open(temp_path) as img:
+                width, height = img.size
+        except Image.DecompressionBombError as e:
+            raise ImageTooLargeError(f"Image too large for OCR: {e}") from e
+        if width * height > MAX_OCR_PIXELS:
+            raise ImageTooLargeError(f"Image too large for OCR: {width}x{height} pixels")
+        
+        # Pass the path straight through; a PIL image would be decoded here and then
+        # re-encoded to a temporary PNG by pytesseract before Tesseract reads it
+        content = image_to_string(temp_path, lang="eng", config=TESSERACT_CONFIG)
+        logger.info(f"OCR extracted text: {content[:100]}...")
+    except ImageTooLargeError:
+        raise
+    except Exception as e:
+        logger.error(f"OCR failed: {e}")
+        content = f"Failed to extract text from image: {str(e)}"
+    return content
@@ -2,16 +2,23 @@
 FastAPI server for handling document uploads and providing legal AI responses
 """
 import os
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Depends
-from fastapi.responses import FileResponse
+import asyncio
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Depends, Request
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 import shutil
+import tempfile
 import mimetypes
 import logging
 from pydantic import BaseModel, Field
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError
 from bson import ObjectId
 import json
+import orjson
 from datetime import datetime, UTC
 from typing import Optional, List
 
@@ -19,37 +26,84 @@ from typing import Optional, List
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# MongoDB setup with better error handling
+# MongoDB setup; the client is created in the startup handler below, on the
+# server's event loop, so importing this module does no network I/O
+MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
+client = None
+db = None
+
+# Import as part of the backend package (uvicorn backend.server:app), or from
+# this directory when run as a script (cd backend && python server.py)
 try:
-    MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
-    client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000)
-    # Test the connection
-    client.admin.command('ping')
-    db = client.kanoonsathi
-    logger.info("Successfully connected to MongoDB")
-except Exception as e:
-    logger.error(f"Failed to connect to MongoDB: {e}")
-    raise
-
-# Add the parent directory to the path so we can import our module
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from backend.legal_ai import LegalAIAssistant
-
-# Import pytesseract and PIL for OCR
-from pytesseract import image_to_string
-from PIL import Image
+    from .legal_ai import LegalAIAssistant
+    from .ocr import init_ocr_worker, run_ocr, ImageTooLargeError
+except ImportError:
+    from legal_ai import LegalAIAssistant
+    from ocr import init_ocr_worker, run_ocr, ImageTooLargeError
 
+# orjson encodes the large analysis payloads much faster than the stdlib json module
 app = FastAPI(title="KanoonSathi API", 
-             description="API for processing legal documents and providing insights")
+             description="API for processing legal documents and providing insights",
+             default_response_class=ORJSONResponse)
+
+# Largest upload accepted, in bytes; bigger files are rejected with 413
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+# Room in an /upload request body for the multipart boundaries and the language field
+UPLOAD_FORM_OVERHEAD_BYTES = 64 * 1024
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject /upload bodies over the size limit before the multipart form is parsed
+    
+    FastAPI reads and spools the whole form before the route handler runs, so the
+    limit has to be enforced here, on the raw ASGI messages. A declared
+    Content-Length over the limit is answered with 413 without reading the body;
+    otherwise the bytes are counted as they arrive and parsing stops with 413
+    once the limit is passed.
+    """
+    def __init__(self, app, max_body_bytes):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] != "/upload":
+            await self.app(scope, receive, send)
+            return
+        
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            response = ORJSONResponse({"detail": "File too large"}, status_code=413)
+            await response(scope, receive, send)
+            return
+        
+        received = 0
+        
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # Raised while the form is being parsed; Starlette's ExceptionMiddleware
+                    # turns the HTTPException into the 413 response
+                    raise HTTPException(status_code=413, detail="File too large")
+            return message
+        
+        await self.app(scope, limited_receive, send)
+
+# Added before CORSMiddleware so that it runs inside it, and 413 responses still
+# carry the CORS headers the frontend needs to read them
+app.add_middleware(UploadSizeLimitMiddleware,
+                   max_body_bytes=MAX_UPLOAD_BYTES + UPLOAD_FORM_OVERHEAD_BYTES)
 
 # Add CORS middleware with environment-based origins and proper configuration
-ALLOWED_ORIGINS = [
-    os.getenv("NEXT_PUBLIC_APP_URL", "http://localhost:3001"),
+ALLOWED_ORIGINS = tuple(origin for origin in (
+    os.getenv("NEXT_PUBLIC_APP_URL", "http://localhost:3000"),  # next dev
     os.getenv("NEXT_PUBLIC_BACKEND_URL", "http://localhost:8001"),
     "http://localhost:5173",  # Vite dev server
-    "*"  # Allow all origins in development
-]
+) if origin)
+if os.getenv("ENV") == "dev":
+    ALLOWED_ORIGINS += ("*",)  # Allow all origins in development only
 
 app.add_middleware(
     CORSMiddleware,
@@ -61,8 +115,170 @@ app.add_middleware(
     max_age=3600,  # Cache preflight requests for 1 hour
 )
 
-# Initialize the Legal AI Assistant
-assistant = LegalAIAssistant()
+@app.on_event("startup")
+async def init_db():
+    """
+    Connect to MongoDB and test the connection before serving requests
+    """
+    global client, db
+    try:
+        client = AsyncIOMotorClient(MONGODB_URI, serverSelectionTimeoutMS=5000)
+        db = client.kanoonsathi
+        await client.admin.command('ping')
+        logger.info("Successfully connected to MongoDB")
+        # Serve the newest-first listing from an index instead of an in-memory sort
+        await db.documents.create_index([("created_at", -1)])
+    except Exception as e:
+        logger.error(f"Failed to connect to MongoDB: {e}")
+        raise
+
+@app.on_event("startup")
+def create_temp_dir():
+    """
+    Create the directory for uploads being processed, once per process
+    """
+    os.makedirs("temp", exist_ok=True)
+
+# Uploads arriving close together are written with one insert_many instead of one
+# round trip each; the worker collects up to INSERT_BATCH_SIZE documents, waiting
+# at most INSERT_BATCH_WINDOW seconds after the first
+INSERT_BATCH_SIZE = 100
+INSERT_BATCH_WINDOW = 0.02
+
+async def insert_documents_worker(pending_docs):
+    """
+    Insert queued documents in batches and resolve each caller's future with its ID
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await pending_docs.get()]
+        deadline = loop.time() + INSERT_BATCH_WINDOW
+        while len(batch) < INSERT_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(pending_docs.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        # insert_many sets each document's _id before sending, so the IDs are known
+        # even when only some of the inserts fail
+        failed = {}
+        try:
+            await db.documents.insert_many([document for document, _ in batch], ordered=False)
+        except BulkWriteError as e:
+            failed = {error["index"]: e for error in e.details.get("writeErrors", [])}
+        except Exception as e:
+            failed = dict.fromkeys(range(len(batch)), e)
+        except BaseException:
+            # Cancelled mid-insert; the batch is no longer in the queue, so fail it here
+            fail_futures(future for _, future in batch)
+            raise
+        
+        for i, (document, future) in enumerate(batch):
+            if future.done():
+                continue
+            if i in failed:
+                future.set_exception(failed[i])
+            else:
+                future.set_result(document["_id"])
+
+def fail_futures(futures):
+    """
+    Fail upload futures that the insert worker can no longer resolve
+    """
+    for future in futures:
+        if not future.done():
+            future.set_exception(RuntimeError("Document insert worker is not running"))
+
+def fail_pending_docs(pending_docs, task):
+    """
+    Fail every queued upload once the insert worker has stopped, so none waits forever
+    """
+    queued = []
+    while not pending_docs.empty():
+        queued.append(pending_docs.get_nowait()[1])
+    fail_futures(queued)
+
+@app.on_event("startup")
+async def start_insert_worker():
+    """
+    Start the background task that writes uploaded documents
+    
+    The queue is created here rather than at import, so it belongs to the
+    event loop that is serving requests.
+    """
+    app.state.pending_docs = asyncio.Queue()
+    app.state.insert_worker = asyncio.create_task(insert_documents_worker(app.state.pending_docs))
+    app.state.insert_worker.add_done_callback(partial(fail_pending_docs, app.state.pending_docs))
+
+@app.on_event("shutdown")
+async def stop_insert_worker():
+    """
+    Stop the document insert task
+    """
+    app.state.insert_worker.cancel()
+
+# The Legal AI Assistant and the OCR pool are created in the startup handler, not at
+# import: spawned OCR workers re-import this module when it is run as a script, and
+# must not each build an assistant or a pool of their own. legal_ai defers its torch
+# and transformers imports to the first model load, so the re-import stays light
+assistant = None
+
+# Upper bound on OCR worker processes; each one holds a decoded page in memory
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "4"))
+
+@app.on_event("startup")
+def init_processing():
+    """
+    Initialize the Legal AI Assistant and start the OCR worker processes
+    
+    OCR is the most CPU-heavy step of an upload; it runs in separate processes so
+    image decoding does not hold the GIL. Each worker runs single-threaded Tesseract,
+    and there are at most OCR_WORKERS of them and never more than one per core.
+    """
+    global assistant
+    if assistant is None:
+        assistant = LegalAIAssistant()
+    app.state.ocr_pool = ProcessPoolExecutor(
+        max_workers=max(1, min(OCR_WORKERS, os.cpu_count() or 1)),
+        initializer=init_ocr_worker
+    )
+
+def save_upload(source, temp_path):
+    """
+    Copy an upload to disk in 64 KiB chunks, stopping once it exceeds MAX_UPLOAD_BYTES
+    
+    Returns the number of bytes copied, which is over the limit if the upload was cut short.
+    Blocking, so callers run it in the threadpool.
+    """
+    total = 0
+    with open(temp_path, "wb") as buffer:
+        while chunk := source.read(1 << 16):
+            total += len(chunk)
+            if total > MAX_UPLOAD_BYTES:
+                break
+            buffer.write(chunk)
+    return total
+
+def read_text_file(temp_path, filename):
+    """
+    Read an uploaded non-image file as text; blocking, so callers run it in the threadpool
+    """
+    try:
+        with open(temp_path, "r", errors="ignore") as text_file:
+            return text_file.read()
+    except Exception as e:
+        logger.error(f"Error reading text file: {e}")
+        return f"Binary content from {filename}"
+
+@app.on_event("shutdown")
+def shutdown_ocr_pool():
+    """
+    Stop the OCR worker processes
+    """
+    app.state.ocr_pool.shutdown(cancel_futures=True)
 
 class DocumentSchema(BaseModel):
     title: str
@@ -95,7 +311,7 @@ async def create_test_document():
             "created_at": datetime.utcnow()
         }
         
-        inserted_doc = db.documents.insert_one(test_doc)
+        inserted_doc = await db.documents.insert_one(test_doc)
         test_doc["_id"] = str(inserted_doc.inserted_id)
         return test_doc
     except Exception as e:
@@ -107,44 +323,43 @@ async def upload_file(
     file: UploadFile = File(...),
     language: str = Form(..., pattern="^(en|hi|bn|te|mr|ta|ur|gu|kn|ml|or|pa|as|mai|sat|ks|ne|sd|kok|doi|mni|sa|bo)$")
 ):
+    temp_path = None
     try:
-        # Create temp directory if it doesn't exist
-        os.makedirs("temp", exist_ok=True)
-        temp_path = os.path.join("temp", file.filename)
+        # Unique name per request, so concurrent uploads of the same file name cannot
+        # overwrite or delete each other; the extension is kept for type detection
+        with tempfile.NamedTemporaryFile(
+            dir="temp", suffix=os.path.splitext(file.filename or "")[1], delete=False
+        ) as tmp:
+            temp_path = tmp.name
         
-        # Read file contents
-        contents = await file.read()
-        with open(temp_path, "wb") as buffer:
-            buffer.write(contents)
+        # Copy the upload to disk in chunks on a worker thread, so the file is never
+        # held in memory whole and the event loop is not blocked. The body size is
+        # already bounded by UploadSizeLimitMiddleware; this applies the exact limit
+        # to the file itself
+        if await run_in_threadpool(save_upload, file.file, temp_path) > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="File too large")
             
-        # Process the uploaded file
-        content = ""
+        # Process the uploaded file off the event loop as well, using OCR for image files
         mime_type, _ = mimetypes.guess_type(temp_path)
-        
-        # Use OCR for image files
         if mime_type and mime_type.startswith('image/'):
             try:
-                with Image.open(temp_path) as img:
-                    content = image_to_string(img, lang="eng")
-                logger.info(f"OCR extracted text: {content[:100]}...")
-            except Exception as e:
-                logger.error(f"OCR failed: {e}")
-                content = f"Failed to extract text from image: {str(e)}"
+                content = await asyncio.get_running_loop().run_in_executor(app.state.ocr_pool, run_ocr, temp_path)
+            except ImageTooLargeError as e:
+                raise HTTPException(status_code=413, detail=str(e))
         else:
-            try:
-                with open(temp_path, "r", errors="ignore") as text_file:
-                    content = text_file.read()
-            except Exception as e:
-                logger.error(f"Error reading text file: {e}")
-                content = f"Binary content from {file.filename}"
+            content = await run_in_threadpool(read_text_file, temp_path, file.filename)
         
-        # Process document and get analysis
-        result = assistant.process_legal_query(content, language="en")
+        # Process document and get analysis. Analysis and translation run on the
+        # threadpool, so the event loop keeps serving other requests during model
+        # inference, and concurrent uploads' translations can share a model batch
+        result = await run_in_threadpool(assistant.process_legal_query, content, language="en")
         
         # Handle translation if needed
         if language != "en":
             try:
-                translated = assistant.handle_translation_request(result["summary"], target_lang=language)
+                translated = await run_in_threadpool(
+                    assistant.handle_translation_request, result["summary"], target_lang=language
+                )
                 result["translated_text"] = translated["translated_text"]
                 result["audio_response"] = translated["audio_response"]
             except Exception as e:
@@ -163,8 +378,12 @@ async def upload_file(
             "created_at": datetime.now(UTC)
         }
         
-        inserted_doc = db.documents.insert_one(document)
-        document_id = str(inserted_doc.inserted_id)
+        # Queue the document for the batched insert and wait for its ID
+        if app.state.insert_worker.done():
+            raise RuntimeError("Document insert worker is not running")
+        future = asyncio.get_running_loop().create_future()
+        await app.state.pending_docs.put((document, future))
+        document_id = str(await future)
         
         # Include the document ID in the response
         return {
@@ -178,25 +397,59 @@ async def upload_file(
         
     except Exception as e:
         logger.error(f"Processing failed: {e}")
+        if isinstance(e, HTTPException):
+            raise e
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         # Clean up the temporary file
-        if os.path.exists(temp_path):
+        if temp_path and os.path.exists(temp_path):
             try:
                 os.remove(temp_path)
             except Exception as e:
                 logger.error(f"Failed to remove temporary file {temp_path}: {e}")
 
+# Fields sent for each document in the /documents list view; the full extracted text
+# and entity list are only returned by /documents/{document_id}
+DOCUMENT_LIST_PROJECTION = {
+    "title": 1,
+    "language": 1,
+    "created_at": 1,
+    "analysis.summary": 1,
+    "analysis.translated_text": 1,
+    "analysis.document_type": 1,
+    "analysis.confidence_score": 1
+}
+
+async def stream_documents(cursor):
+    """
+    Yield documents from a cursor as NDJSON lines
+    """
+    async for doc in cursor:
+        doc["_id"] = str(doc["_id"])
+        yield orjson.dumps(doc) + b"\n"
+
 @app.get("/documents")
-async def get_documents(limit: int = 10, skip: int = 0):
+async def get_documents(limit: int = 10, skip: int = 0, stream: bool = False,
+                        before: Optional[datetime] = None):
     """
     Get list of processed documents
+    
+    For deep pagination, pass the created_at of the last document seen as
+    before instead of a growing skip; the index then seeks straight to the page.
+    
+    With stream=true the documents are sent as NDJSON, one per line, while the
+    cursor is read, instead of being collected into a single JSON array first.
     """
     try:
-        documents = list(db.documents.find({})
-                        .sort("created_at", -1)
-                        .skip(skip)
-                        .limit(limit))
+        query = {"created_at": {"$lt": before}} if before is not None else {}
+        cursor = (db.documents.find(query, DOCUMENT_LIST_PROJECTION)
+                  .sort("created_at", -1)
+                  .skip(skip)
+                  .limit(limit))
+        if stream:
+            return StreamingResponse(stream_documents(cursor), media_type="application/x-ndjson")
+        
+        documents = await cursor.to_list(length=limit)
         
         # Convert ObjectId to string for JSON serialization
         for doc in documents:
@@ -221,7 +474,7 @@ async def get_document(document_id: str):
             raise HTTPException(status_code=400, detail="Invalid document ID format")
             
         logger.info("Looking up document in MongoDB...")
-        document = db.documents.find_one({"_id": ObjectId(document_id)})
+        document = await db.documents.find_one({"_id": ObjectId(document_id)})
         
         if not document:
             logger.error(f"Document not found for ID: {document_id}")
@@ -239,18 +492,35 @@ async def get_document(document_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/audio/{filename}")
-def get_audio(filename: str):
+def get_audio(filename: str, request: Request):
     """
     Serve audio files
+    
+    Audio files are renamed into place only once fully written and never change
+    afterwards, so the browser may cache them for a day and revalidate with the
+    ETag, which is answered with 304 when unchanged. They belong to a single
+    user's request, so shared caches must not store them.
     """
+    # Files still being written carry a .part suffix and are never served
+    if filename.endswith(".part"):
+        raise HTTPException(status_code=404, detail="Audio file not found")
     audio_path = os.path.join("temp", filename)
-    if not os.path.exists(audio_path):
+    try:
+        stat = os.stat(audio_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Audio file not found")
     
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=86400"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
     return FileResponse(
         path=audio_path,
         media_type="audio/wav",
-        filename=filename
+        filename=filename,
+        headers=headers,
+        stat_result=stat
     )
 
 class TodoSchema(BaseModel):
@@ -264,7 +534,7 @@ async def get_todos():
     Get list of todos
     """
     try:
-        todos = list(db.todos.find({}).sort("created_at", -1))
+        todos = await db.todos.find({}).sort("created_at", -1).to_list(length=None)
         # Convert ObjectId to string for JSON serialization
         for todo in todos:
             todo["_id"] = str(todo["_id"])
@@ -279,8 +549,8 @@ async def create_todo(todo: TodoSchema):
     Create a new todo
     """
     try:
-        result = db.todos.insert_one(todo.dict())
-        created_todo = db.todos.find_one({"_id": result.inserted_id})
+        result = await db.todos.insert_one(todo.dict())
+        created_todo = await db.todos.find_one({"_id": result.inserted_id})
         created_todo["_id"] = str(created_todo["_id"])
         return created_todo
     except Exception as e: